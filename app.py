@@ -1,11 +1,18 @@
 import streamlit as st
 import json
+import operator
 import random
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+import sys
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import orjson  # C実装の高速JSONパーサ
+except ImportError:
+    orjson = None
 
 # データクラス定義
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Poem:
     id: int
     author: str
@@ -15,15 +22,24 @@ class Poem:
     reading_lower: str  # 下の句読み
     description: str  # 解説
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Question:
     poem: Poem
     question_text: str  # 問題文（上の句 or 全句）
     choices: List[str]  # 選択肢
     correct_answer: str  # 正解
     question_type: str  # "lower_verse" or "author"
+    labels: Tuple[str, ...] = field(init=False, repr=False, compare=False)  # 番号付き選択肢ラベル
+    correct_idx: int = field(init=False, repr=False, compare=False)  # 正解の選択肢番号（0始まり）
+    
+    def __post_init__(self):
+        object.__setattr__(
+            self, 'labels',
+            tuple(f"{i}. {choice}" for i, choice in enumerate(self.choices, 1))
+        )
+        object.__setattr__(self, 'correct_idx', self.choices.index(self.correct_answer))
 
-@dataclass
+@dataclass(slots=True)
 class Score:
     correct: int
     total: int
@@ -31,42 +47,114 @@ class Score:
     @property
     def percentage(self) -> float:
         return (self.correct / self.total * 100) if self.total > 0 else 0
+    
+    def reset(self):
+        """スコアを0に戻す（オブジェクトは再利用）"""
+        self.correct = self.total = 0
+
+# フォールバック用のサンプルデータ（インポート時に一度だけ生成）
+_FALLBACK_POEMS: Tuple[Poem, ...] = tuple(Poem(**poem_data) for poem_data in (
+    {
+        "id": 1,
+        "author": "天智天皇",
+        "upper": "秋の田の かりほの庵の 苫をあらみ",
+        "lower": "わが衣手は 露にぬれつつ",
+        "reading_upper": "あきのたの かりほのいほの とまをあらみ",
+        "reading_lower": "わがころもでは つゆにぬれつつ",
+        "description": "稲刈り期の仮小屋での体験を詠んだ歌"
+    },
+    {
+        "id": 2,
+        "author": "持統天皇",
+        "upper": "春過ぎて 夏来にけらし 白妙の",
+        "lower": "衣ほすてふ 天の香具山",
+        "reading_upper": "はるすぎて なつきにけらし しろたえの",
+        "reading_lower": "ころもほすてふ あまのかぐやま",
+        "description": "季節の移ろいを香具山の情景で詠んだ歌"
+    },
+    {
+        "id": 3,
+        "author": "柿本人麻呂",
+        "upper": "あしびきの 山鳥の尾の しだり尾の",
+        "lower": "ながながし夜を ひとりかも寝む",
+        "reading_upper": "あしびきの やまどりのおの しだりおの",
+        "reading_lower": "ながながしよを ひとりかもねむ",
+        "description": "長い夜の孤独を山鳥の尾に例えた恋歌"
+    },
+    {
+        "id": 4,
+        "author": "山部赤人",
+        "upper": "田子の浦に うち出でて見れば 白妙の",
+        "lower": "富士の高嶺に 雪は降りつつ",
+        "reading_upper": "たごのうらに うちいでてみれば しろたえの",
+        "reading_lower": "ふじのたかねに ゆきはふりつつ",
+        "description": "田子の浦から望む富士の嶺に、雪がしきりに降る清澄の景"
+    },
+    {
+        "id": 5,
+        "author": "猿丸太夫",
+        "upper": "奥山に もみぢ踏み分け 鳴く鹿の",
+        "lower": "声聞く時ぞ 秋は悲しき",
+        "reading_upper": "おくやまに もみぢふみわけ なくしかの",
+        "reading_lower": "こえきくときぞ あきはかなしき",
+        "description": "奥山で鹿の声を聞く瞬間、秋の寂寥が胸に満ちる"
+    }
+))
+
+# Poemの必須フィールド
+_REQUIRED_FIELDS = frozenset(('id', 'author', 'upper', 'lower',
+                              'reading_upper', 'reading_lower', 'description'))
+
+# データ読み込み（全セッションで共有）
+@st.cache_data(show_spinner=False)
+def _load_poems(json_path: str) -> Tuple[Poem, ...]:
+    """JSONファイルを読み込み、検証済みのPoemのタプルを返す"""
+    with open(json_path, 'rb') as file:
+        raw = file.read()
+    # orjson.JSONDecodeErrorはjson.JSONDecodeErrorのサブクラス
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    
+    # データ検証
+    if not isinstance(data, list):
+        raise ValueError("JSONデータはリスト形式である必要があります")
+    
+    # データをPoemオブジェクトに変換
+    poems = []
+    for poem_data in data:
+        # 必須フィールドの確認
+        missing = _REQUIRED_FIELDS.difference(poem_data)
+        if missing:
+            raise ValueError(f"必須フィールド {', '.join(sorted(missing))} が見つかりません")
+        
+        # 作者名は選択肢や比較で繰り返し使うため共有文字列にする
+        poem_data['author'] = sys.intern(poem_data['author'])
+        poem = Poem(**poem_data)
+        poems.append(poem)
+    
+    if len(poems) == 0:
+        raise ValueError("有効なデータが見つかりません")
+    
+    return tuple(poems)
 
 # データ管理コンポーネント
 class HyakuninIsshuData:
     def __init__(self, json_path: str = "./hyakunin_isshu.json"):
         self.json_path = json_path
         self.poems: List[Poem] = []
+        self.is_fallback = False  # サンプルデータで代用しているか
+        self._by_author: Dict[str, Poem] = {}
+        self._unique_authors: List[str] = []
+        # 下の句の並列リスト（poemsと同じ並び、選択肢の抽出用）
+        self.lowers: List[str] = []
         self.load_data()
     
-    def load_data(self) -> List[Dict]:
+    def load_data(self) -> List[Poem]:
         """JSONファイルからデータを読み込む"""
         try:
-            # 実際のJSONファイルから読み込み
-            with open(self.json_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-            
-            # データ検証
-            if not isinstance(data, list):
-                raise ValueError("JSONデータはリスト形式である必要があります")
-            
-            # データをPoemオブジェクトに変換
-            self.poems = []
-            for poem_data in data:
-                # 必須フィールドの確認
-                required_fields = ['id', 'author', 'upper', 'lower', 
-                                 'reading_upper', 'reading_lower', 'description']
-                for field in required_fields:
-                    if field not in poem_data:
-                        raise ValueError(f"必須フィールド '{field}' が見つかりません")
-                
-                poem = Poem(**poem_data)
-                self.poems.append(poem)
-            
-            if len(self.poems) == 0:
-                raise ValueError("有効なデータが見つかりません")
-                
-            return data
+            # 解析済みデータはプロセス全体でキャッシュされる
+            self.poems = list(_load_poems(self.json_path))
+            self._build_index()
+            return self.poems
             
         except FileNotFoundError:
             st.error(f"ファイルが見つかりません: {self.json_path}")
@@ -83,77 +171,48 @@ class HyakuninIsshuData:
     
     def _load_fallback_data(self):
         """フォールバック用のサンプルデータを読み込み"""
-        fallback_data = [
-            {
-                "id": 1,
-                "author": "天智天皇",
-                "upper": "秋の田の かりほの庵の 苫をあらみ",
-                "lower": "わが衣手は 露にぬれつつ",
-                "reading_upper": "あきのたの かりほのいほの とまをあらみ",
-                "reading_lower": "わがころもでは つゆにぬれつつ",
-                "description": "稲刈り期の仮小屋での体験を詠んだ歌"
-            },
-            {
-                "id": 2,
-                "author": "持統天皇",
-                "upper": "春過ぎて 夏来にけらし 白妙の",
-                "lower": "衣ほすてふ 天の香具山",
-                "reading_upper": "はるすぎて なつきにけらし しろたえの",
-                "reading_lower": "ころもほすてふ あまのかぐやま",
-                "description": "季節の移ろいを香具山の情景で詠んだ歌"
-            },
-            {
-                "id": 3,
-                "author": "柿本人麻呂",
-                "upper": "あしびきの 山鳥の尾の しだり尾の",
-                "lower": "ながながし夜を ひとりかも寝む",
-                "reading_upper": "あしびきの やまどりのおの しだりおの",
-                "reading_lower": "ながながしよを ひとりかもねむ",
-                "description": "長い夜の孤独を山鳥の尾に例えた恋歌"
-            },
-            {
-                "id": 4,
-                "author": "山部赤人",
-                "upper": "田子の浦に うち出でて見れば 白妙の",
-                "lower": "富士の高嶺に 雪は降りつつ",
-                "reading_upper": "たごのうらに うちいでてみれば しろたえの",
-                "reading_lower": "ふじのたかねに ゆきはふりつつ",
-                "description": "田子の浦から望む富士の嶺に、雪がしきりに降る清澄の景"
-            },
-            {
-                "id": 5,
-                "author": "猿丸太夫",
-                "upper": "奥山に もみぢ踏み分け 鳴く鹿の",
-                "lower": "声聞く時ぞ 秋は悲しき",
-                "reading_upper": "おくやまに もみぢふみわけ なくしかの",
-                "reading_lower": "こえきくときぞ あきはかなしき",
-                "description": "奥山で鹿の声を聞く瞬間、秋の寂寥が胸に満ちる"
-            }
-        ]
-        
-        self.poems = []
-        for poem_data in fallback_data:
-            poem = Poem(**poem_data)
-            self.poems.append(poem)
+        self.poems = list(_FALLBACK_POEMS)
+        self.is_fallback = True
+        self._build_index()
         
         st.warning("サンプルデータを使用しています。正しいJSONファイルを配置してください。")
     
-    def get_random_poem(self) -> Optional[Poem]:
-        """ランダムに1首を取得"""
-        if self.poems:
-            return random.choice(self.poems)
-        return None
-    
-    def get_random_poems(self, count: int) -> List[Poem]:
-        """ランダムに複数首を取得"""
-        if len(self.poems) >= count:
-            return random.sample(self.poems, count)
-        return self.poems.copy()
+    def _build_index(self):
+        """抽選用のインデックスを構築"""
+        self.lowers = [poem.lower for poem in self.poems]
+        # 作者ごとの代表歌（作者名の重複を除いた選択肢用）
+        self._by_author = {}
+        for poem in self.poems:
+            if poem.author not in self._by_author:
+                self._by_author[poem.author] = poem
+        self._unique_authors = list(self._by_author)
+    
+    def get_random_poems(self, count: int,
+                         rng: Optional[random.Random] = None) -> List[Poem]:
+        """ランダムに複数首を取得（歌数が足りない場合は全首をシャッフルして返す）"""
+        rng = rng or random
+        return rng.sample(self.poems, min(count, len(self.poems)))
+    
+    @property
+    def author_count(self) -> int:
+        """重複を除いた作者の人数"""
+        return len(self._unique_authors)
+    
+    def get_random_authors(self, author: str, count: int,
+                           rng: Optional[random.Random] = None) -> List[str]:
+        """指定の作者を含む、重複のない作者名をcount人分取得"""
+        rng = rng or random
+        authors = rng.sample(self._unique_authors, count)
+        if author not in authors:
+            authors[-1] = author
+        return authors
 
 # ゲーム管理コンポーネント
 class GameManager:
-    def __init__(self, data: HyakuninIsshuData):
+    def __init__(self, data: HyakuninIsshuData, seed: Optional[int] = None):
         self.data = data
+        # セッションごとに独立した乱数列（データは全セッションで共有）
+        self._rng = random.Random(seed)
     
     def generate_lower_verse_question(self) -> Optional[Question]:
         """下の句当て問題を生成"""
@@ -162,19 +221,13 @@ class GameManager:
             return None
         
         try:
-            # 正解となる歌を選択
-            correct_poem = self.data.get_random_poem()
-            if not correct_poem:
-                return None
-            
-            # 選択肢用の歌を3首選択（正解を除く）
-            other_poems = [p for p in self.data.poems if p.id != correct_poem.id]
-            choice_poems = random.sample(other_poems, 3)
+            # 正解1首と選択肢用の3首を一度に選択（重複なし）
+            idxs = self._rng.sample(range(len(self.data.poems)), 4)
+            correct_poem = self.data.poems[idxs[0]]
             
             # 選択肢を作成（下の句）
-            choices = [poem.lower for poem in choice_poems]
-            choices.append(correct_poem.lower)
-            random.shuffle(choices)
+            choices = list(operator.itemgetter(*idxs)(self.data.lowers))
+            self._rng.shuffle(choices)
             
             # 問題オブジェクトを作成
             question = Question(
@@ -193,37 +246,17 @@ class GameManager:
     
     def generate_author_question(self) -> Optional[Question]:
         """作者当て問題を生成"""
-        if len(self.data.poems) < 4:
-            st.error("問題生成に必要な歌が不足しています（最低4首必要）")
+        if self.data.author_count < 4:
+            st.error("問題生成に必要な作者が不足しています（最低4人必要）")
             return None
         
         try:
             # 正解となる歌を選択
-            correct_poem = self.data.get_random_poem()
-            if not correct_poem:
-                return None
-            
-            # 選択肢用の歌を3首選択（正解を除く）
-            other_poems = [p for p in self.data.poems if p.id != correct_poem.id]
-            choice_poems = random.sample(other_poems, 3)
-            
-            # 選択肢を作成（作者名）
-            choices = [poem.author for poem in choice_poems]
-            choices.append(correct_poem.author)
-            # 重複削除して再度選択肢を調整
-            choices = list(set(choices))
+            correct_poem = self._rng.choice(self.data.poems)
             
-            # 選択肢が4つ未満の場合、追加で歌を選択
-            while len(choices) < 4 and len(other_poems) > len(choices) - 1:
-                additional_poems = [p for p in other_poems 
-                                 if p.author not in choices and p.id != correct_poem.id]
-                if additional_poems:
-                    additional_poem = random.choice(additional_poems)
-                    choices.append(additional_poem.author)
-                else:
-                    break
-            
-            random.shuffle(choices)
+            # 選択肢を作成（作者名、正解を含む重複なしの4人）
+            choices = self.data.get_random_authors(correct_poem.author, 4, self._rng)
+            self._rng.shuffle(choices)
             
             # 問題文（上の句＋下の句）
             question_text = f"{correct_poem.upper}\n{correct_poem.lower}"
@@ -258,21 +291,30 @@ class GameManager:
     
     def reset_game(self):
         """ゲームリセット"""
-        st.session_state.score = Score(0, 0)
-        if 'current_question' in st.session_state:
-            del st.session_state.current_question
-        if 'show_result' in st.session_state:
-            del st.session_state.show_result
-        if 'user_answer' in st.session_state:
-            del st.session_state.user_answer
-        if 'question_answered' in st.session_state:
-            del st.session_state.question_answered
+        ss = st.session_state
+        if 'score' in ss:
+            ss.score.reset()
+        else:
+            ss.score = Score(0, 0)
+        ss.current_question = None
+        ss.show_result = False
+        ss.user_answer_idx = None
+        ss.question_answered = False
+
+@st.cache_resource(show_spinner=False)
+def get_data() -> HyakuninIsshuData:
+    """データ管理オブジェクトを取得（サーバー全体で1インスタンス）"""
+    return HyakuninIsshuData()
 
 # セッション状態初期化
 def initialize_session_state():
     """Streamlit Session Stateの初期化"""
     if 'data' not in st.session_state:
-        st.session_state.data = HyakuninIsshuData()
+        data = get_data()
+        if data.is_fallback:
+            # 読み込み失敗時の結果は共有せず、次のセッションで再読み込みする
+            get_data.clear()
+        st.session_state.data = data
     
     if 'game_manager' not in st.session_state:
         st.session_state.game_manager = GameManager(st.session_state.data)
@@ -289,16 +331,19 @@ def initialize_session_state():
     if 'current_question' not in st.session_state:
         st.session_state.current_question = None
     
-    if 'user_answer' not in st.session_state:
-        st.session_state.user_answer = None
+    if 'user_answer_idx' not in st.session_state:
+        st.session_state.user_answer_idx = None
     
     if 'question_answered' not in st.session_state:
         st.session_state.question_answered = False
+    
+    if 'question_seq' not in st.session_state:
+        st.session_state.question_seq = 0  # 選択肢ウィジェットのキー用の問題番号
 
 def reset_question_state():
     """問題関連の状態をリセット"""
     st.session_state.current_question = None
-    st.session_state.user_answer = None
+    st.session_state.user_answer_idx = None
     st.session_state.show_result = False
     st.session_state.question_answered = False
 
@@ -306,40 +351,48 @@ def generate_new_question():
     """新しい問題を生成"""
     reset_question_state()
     
-    if st.session_state.game_mode == "下の句当て":
-        question = st.session_state.game_manager.generate_lower_verse_question()
+    ss = st.session_state
+    ss.question_seq += 1
+    if ss.game_mode == "下の句当て":
+        question = ss.game_manager.generate_lower_verse_question()
     else:  # 作者当て
-        question = st.session_state.game_manager.generate_author_question()
+        question = ss.game_manager.generate_author_question()
     
-    st.session_state.current_question = question
+    ss.current_question = question
     return question
 
-def handle_answer_click(selected_choice: str):
+def handle_answer_click(selected_idx: int):
     """回答選択時の処理"""
-    if not st.session_state.question_answered:
-        st.session_state.user_answer = selected_choice
-        st.session_state.question_answered = True
+    ss = st.session_state
+    if not ss.question_answered:
+        question = ss.current_question
+        selected_choice = question.choices[selected_idx]
+        ss.user_answer_idx = selected_idx
+        ss.question_answered = True
         
         # 正誤判定
-        question = st.session_state.current_question
-        is_correct = st.session_state.game_manager.check_answer(
+        game_manager = ss.game_manager
+        is_correct = game_manager.check_answer(
             selected_choice, question.correct_answer
         )
         
         # スコア更新
-        st.session_state.game_manager.update_score(is_correct)
-        st.session_state.show_result = True
+        game_manager.update_score(is_correct)
+        ss.show_result = True
         
-        # 画面を更新
+        # サイドバーのスコアも更新するためアプリ全体を再実行
         st.rerun()
 
+@st.fragment
 def render_game_ui():
-    """ゲームUI表示"""
+    """ゲームUI表示（操作時はこの部分だけ再実行される）"""
+    ss = st.session_state
+    
     # 現在の問題がない場合は新しい問題を生成
-    if st.session_state.current_question is None:
-        generate_new_question()
+    question = ss.current_question
+    if question is None:
+        question = generate_new_question()
     
-    question = st.session_state.current_question
     if not question:
         st.error("問題を生成できませんでした。")
         return
@@ -368,31 +421,37 @@ def render_game_ui():
     st.markdown("### 選択肢")
     
     # 回答済みかどうかで処理を分岐
-    if not st.session_state.question_answered:
-        # 未回答の場合：選択肢ボタンを表示
-        cols = st.columns(1)
-        for i, choice in enumerate(question.choices, 1):
-            if st.button(f"{i}. {choice}", key=f"choice_{i}", use_container_width=True):
-                handle_answer_click(choice)
+    if not ss.question_answered:
+        # 未回答の場合：選択肢を1つのラジオで表示（問題ごとにキーを変えて選択状態を持ち越さない）
+        selected_idx = st.radio(
+            "選択肢",
+            range(len(question.choices)),
+            index=None,
+            format_func=question.labels.__getitem__,
+            key=f"choice_radio_{ss.question_seq}",
+            label_visibility="collapsed"
+        )
+        if selected_idx is not None:
+            handle_answer_click(selected_idx)
     else:
         # 回答済みの場合：結果表示
-        user_answer = st.session_state.user_answer
-        correct_answer = question.correct_answer
-        is_correct = user_answer == correct_answer
+        user_idx = ss.user_answer_idx
+        correct_idx = question.correct_idx
+        is_correct = user_idx == correct_idx
         
         # 選択肢を色分けして表示
-        for i, choice in enumerate(question.choices, 1):
-            if choice == correct_answer:
+        for i, choice in enumerate(question.choices):
+            if i == correct_idx:
                 # 正解の選択肢
-                st.markdown(f'<div class="result-correct">✅ {i}. {choice} (正解)</div>', 
+                st.markdown(f'<div class="result-correct">✅ {i + 1}. {choice} (正解)</div>', 
                            unsafe_allow_html=True)
-            elif choice == user_answer and not is_correct:
+            elif i == user_idx:
                 # 不正解の選択肢（ユーザーが選択）
-                st.markdown(f'<div class="result-incorrect">❌ {i}. {choice} (あなたの回答)</div>', 
+                st.markdown(f'<div class="result-incorrect">❌ {i + 1}. {choice} (あなたの回答)</div>', 
                            unsafe_allow_html=True)
             else:
                 # その他の選択肢
-                st.markdown(f'<div style="padding: 0.5rem; margin: 0.25rem 0; border: 1px solid #ddd; border-radius: 5px;">{i}. {choice}</div>', 
+                st.markdown(f'<div style="padding: 0.5rem; margin: 0.25rem 0; border: 1px solid #ddd; border-radius: 5px;">{i + 1}. {choice}</div>', 
                            unsafe_allow_html=True)
         
         # 結果メッセージ
@@ -419,14 +478,12 @@ def render_game_ui():
         st.markdown(description_html, unsafe_allow_html=True)
 
         # 次の問題ボタン
-        if st.button("🔄 次の問題", use_container_width=True):
-            generate_new_question()
-            st.rerun()
+        # コールバックで問題を生成し、フラグメントの再実行で表示する
+        st.button("🔄 次の問題", use_container_width=True, on_click=generate_new_question)
 
 # UIコンポーネント
-def apply_custom_css():
-    """カスタムCSSスタイルを適用"""
-    st.markdown("""
+# カスタムCSS（モジュール読み込み時に一度だけ生成）
+_CUSTOM_CSS = """
     <style>
     /* メインテーマ */
     .main-header {
@@ -510,6 +567,21 @@ def apply_custom_css():
         box-shadow: 0 4px 8px rgba(30, 58, 138, 0.3);
     }
     
+    /* 選択肢ラジオ */
+    .stRadio div[role="radiogroup"] > label {
+        width: 100%;
+        min-height: 60px;
+        border-radius: 10px;
+        border: 2px solid #1e3a8a;
+        padding: 10px;
+        margin: 0.25rem 0;
+    }
+    
+    .stRadio div[role="radiogroup"] > label p {
+        font-size: 1.3rem;
+        white-space: normal;
+    }
+    
     /* 正解・不正解の表示 */
     .result-correct {
         background-color: #dcfce7;
@@ -568,12 +640,15 @@ def apply_custom_css():
         margin: 1rem 0;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+# CSSとタイトルを1要素にまとめたヘッダーHTML
+# （再実行時に出力しない要素は画面から消えるため、毎回1回のmarkdownで出力する）
+_HEADER_HTML = _CUSTOM_CSS + '<h1 class="main-header">🌸 百人一首クイズ 🌸</h1>'
 
 def render_header():
-    """アプリケーションヘッダー"""
-    apply_custom_css()
-    st.markdown('<h1 class="main-header">🌸 百人一首クイズ 🌸</h1>', unsafe_allow_html=True)
+    """アプリケーションヘッダー（カスタムCSSを含む）"""
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     st.markdown("### 📚 古典文学を楽しく学ぼう")
     st.write("Pwored by Kiro + Claude")
 
@@ -583,29 +658,32 @@ def render_sidebar():
     """サイドバー"""
     st.sidebar.title("ゲーム設定")
     
+    ss = st.session_state
+    
     # ゲームモード選択
     game_modes = ["下の句当て", "作者当て"]
+    game_mode = ss.game_mode
     selected_mode = st.sidebar.selectbox(
         "ゲームモード",
         game_modes,
-        index=game_modes.index(st.session_state.game_mode)
+        index=game_modes.index(game_mode)
     )
     
-    if selected_mode != st.session_state.game_mode:
-        st.session_state.game_mode = selected_mode
+    if selected_mode != game_mode:
+        ss.game_mode = selected_mode
         reset_question_state()  # モード変更時に問題をリセット
         st.rerun()
     
     # スコア表示
     st.sidebar.markdown("### 📊 スコア")
-    score = st.session_state.score
+    score = ss.score
     st.sidebar.metric("正解数", f"{score.correct}/{score.total}")
-    if score.total > 0:
+    if score.total:
         st.sidebar.metric("正解率", f"{score.percentage:.1f}%")
     
     # リセットボタン
     if st.sidebar.button("🔄 スコアリセット"):
-        st.session_state.game_manager.reset_game()
+        ss.game_manager.reset_game()
         st.rerun()
     
     # 新しい問題ボタン